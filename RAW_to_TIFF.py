@@ -1,8 +1,64 @@
 import numpy as np
+import tifffile
 from PIL import Image
+import io
 import os
+import queue
+import shutil
+import struct
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
 import matplotlib.pyplot as plt
 
+# TIFFs are written in tiles with fast deflate, the predictor keeps the ratio high on smooth sensor data
+TIFF_TILE = (256, 256)
+TIFF_DEFLATE_LEVEL = 1
+
+# TIFF field types used in the prebuilt header of uncompressed TIFFs
+_TIFF_SHORT = 3
+_TIFF_LONG = 4
+
+# Images are downsampled for display to at most this many pixels along their longest side
+DISPLAY_MAX_SIZE = 1024
+
+# RAW pixel data is read front to back in large requests
+READ_BUFFER_SIZE = 1 << 20
+
+# Supported pixel data types by bits per pixel
+_DTYPE_BY_BITS = {16: np.uint16, 8: np.uint8}
+
+
+def _data_type(bits):
+    """
+    Returns the NumPy pixel data type for the given bits per pixel.
+
+    :param bits: Bits per pixel (16 or 8).
+    :return: NumPy pixel data type.
+    """
+    try:
+        return _DTYPE_BY_BITS[bits]
+    except KeyError:
+        raise KeyError(f"Unsupported pixel type: {bits} bits, expected 16 or 8.") from None
+
+
+def _open_sequential(file_path):
+    """
+    Opens a file for reading with a large buffer and a sequential access hint for the OS.
+
+    :param file_path: Path to the file.
+    :return: Binary file object.
+    """
+    # O_SEQUENTIAL and O_BINARY only exist on Windows, posix_fadvise only on POSIX systems
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0) | getattr(os, 'O_SEQUENTIAL', 0))
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass  # The hint is best-effort, some filesystems reject it
+    return os.fdopen(fd, 'rb', buffering=READ_BUFFER_SIZE)
+
 
 def read_raw_parameters(file_path):
     """
@@ -13,131 +69,537 @@ def read_raw_parameters(file_path):
     """
     with open(file_path, 'rb') as file:
         # Assumes that parameters are stored in uint16 format.
-        parameters = np.fromfile(file, dtype=np.uint16, count=5)
+        parameters = np.empty(5, dtype=np.uint16)
+        bytes_read = file.readinto(parameters.view(np.uint8))
+    if bytes_read != parameters.nbytes:
+        raise ValueError(f"RAW header too short: expected {parameters.nbytes} bytes, got {bytes_read}")
 
-    width = parameters[0]
-    height = parameters[1]
-    data_type = np.uint16 if parameters[2] == 16 else np.uint8
-    header_size = parameters[4]
+    width = int(parameters[0])
+    height = int(parameters[1])
+    data_type = _data_type(int(parameters[2]))
+    header_size = int(parameters[4])
 
     return width, height, data_type, header_size
 
 
-def process_raw_file(file_path, width=-1, height=-1, pixel_type=-1, header_size=-1, save_tiff=True, tiff_path=None):
+def _check_raw_size(file_size, expected_size):
     """
-    Processes a RAW file into an image, reading parameters from the file if set to -1,
-    and optionally saves it as a TIFF.
+    Raises a ValueError if a RAW file is not exactly the header plus the pixel data.
+    """
+    if file_size != expected_size:
+        raise ValueError(f"file has {file_size} bytes but the header and pixel data need {expected_size}")
+
+
+def read_raw_data(file_path, width, height, data_type, header_size, memory_map=False):
+    """
+    Reads the pixel data of a RAW file into an array of shape (height, width).
+
+    The whole file is read in one go and the pixels are viewed without copying,
+    so the returned array is read-only. With memory_map=True the file is mapped
+    instead, and pixels are only paged in when they are accessed.
+
+    :param file_path: Path to the RAW file.
+    :param width: Image width.
+    :param height: Image height.
+    :param data_type: NumPy pixel data type.
+    :param header_size: Header size in bytes.
+    :param memory_map: Whether to memory-map the file instead of reading it.
+    :return: Read-only array with the image data.
+    :raises ValueError: If the file size does not match the header size plus the pixel data.
+    """
+    # A wrong width, height or header size would otherwise give a shifted image without any error
+    expected_size = header_size + width * height * np.dtype(data_type).itemsize
+
+    # Mapping with an offset that is not a multiple of the pixel size gives a misaligned array
+    if memory_map and header_size % np.dtype(data_type).itemsize == 0:
+        _check_raw_size(os.path.getsize(file_path), expected_size)
+        return np.memmap(file_path, dtype=data_type, mode='r', offset=header_size, shape=(height, width))
+
+    with _open_sequential(file_path) as file:
+        raw_bytes = file.read()
+    _check_raw_size(len(raw_bytes), expected_size)
+    return np.frombuffer(raw_bytes, dtype=data_type, offset=header_size,
+                         count=width * height).reshape(height, width)
+
+
+def make_raw_reader(width, height, pixel_type, header_size):
+    """
+    Creates a reader for a batch of RAW files that share the same parameters.
+
+    The pixel type is validated and the shape, data type and pixel byte count are worked
+    out once, so reading each file only allocates the array and fills it.
+
+    :param width: Image width.
+    :param height: Image height.
+    :param pixel_type: Pixel data type (16 or 8).
+    :param header_size: Header size in bytes.
+    :return: Function taking a RAW file path and returning an array with the image data.
+    """
+    data_type = _data_type(pixel_type)
+    shape = (height, width)
+    nbytes = width * height * np.dtype(data_type).itemsize
+
+    def read(file_path):
+        image_data = np.empty(shape, dtype=data_type)
+        with _open_sequential(file_path) as file:
+            # Hand-typed parameters that do not match the file must not give a shifted image
+            _check_raw_size(os.fstat(file.fileno()).st_size, header_size + nbytes)
+            file.seek(header_size)
+            bytes_read = file.readinto(image_data.reshape(-1).view(np.uint8))
+        if bytes_read != nbytes:
+            raise ValueError(f"expected {nbytes} bytes of pixel data, got {bytes_read}")
+        return image_data
+
+    return read
+
+
+def _read_or_report(read, file_path):
+    """
+    Reads a RAW file with a reader from make_raw_reader, reporting a size mismatch instead of raising.
+
+    :return: Array with the image data, or None if it could not be read.
+    """
+    try:
+        return read(file_path)
+    except ValueError as e:
+        print(f"Error: {e}. Check the provided dimensions and header size.")
+        return None
+
+
+def load_raw_image(file_path, width=-1, height=-1, pixel_type=-1, header_size=-1, memory_map=False):
+    """
+    Loads the image data of a RAW file, reading parameters from the file if set to -1.
 
     :param file_path: Path to the RAW file.
     :param width: Image width or -1.
     :param height: Image height or -1.
     :param pixel_type: Pixel data type (16 or 8) or -1.
     :param header_size: Header size in bytes or -1.
-    :param save_tiff: Whether to save the result as a TIFF file.
-    :param tiff_path: Path to save the TIFF file.
+    :param memory_map: Whether to memory-map the file instead of reading it.
+    :return: Array with the image data, or None if it could not be read.
     """
-    # If any parameter is set to -1, read parameters from the file
-    if width == -1 or height == -1 or pixel_type == -1 or header_size == -1:
-        width, height, data_type, header_size = read_raw_parameters(file_path)
-    else:
-        data_type = np.uint16 if pixel_type == 16 else np.uint8
-
-    image_dims = (height, width)
-
-    with open(file_path, 'rb') as file:
-        file.seek(header_size)
-        raw_data = np.fromfile(file, dtype=data_type)
+    try:
+        # If any parameter is set to -1, read parameters from the file
+        if width == -1 or height == -1 or pixel_type == -1 or header_size == -1:
+            width, height, data_type, header_size = read_raw_parameters(file_path)
+        else:
+            data_type = _data_type(pixel_type)
+    except KeyError as e:
+        print(f"Error: {e.args[0]} Check the pixel type of {file_path}.")
+        return None
+    except ValueError as e:
+        print(f"Error: {e} in {file_path}.")
+        return None
 
     try:
-        image_data = raw_data.reshape(image_dims)
+        return read_raw_data(file_path, width, height, data_type, header_size, memory_map=memory_map)
     except ValueError as e:
         print(f"Error: {e}. Check the provided dimensions and header size.")
+        return None
+
+
+def process_raw_file(file_path, width=-1, height=-1, pixel_type=-1, header_size=-1, save_tiff=True, tiff_path=None,
+                     compression='zlib'):
+    """
+    Processes a RAW file into an image, reading parameters from the file if set to -1,
+    and optionally saves it as a TIFF.
+
+    :param file_path: Path to the RAW file.
+    :param width: Image width or -1.
+    :param height: Image height or -1.
+    :param pixel_type: Pixel data type (16 or 8) or -1.
+    :param header_size: Header size in bytes or -1.
+    :param save_tiff: Whether to save the result as a TIFF file.
+    :param tiff_path: Path to save the TIFF file.
+    :param compression: TIFF compression passed to tifffile, 'zlib' or None (other codecs need imagecodecs).
+    :return: Array with the image data, or None if it could not be read.
+    """
+    # The pixels are only passed on to the TIFF encoder when saving, so map them instead of reading
+    image_data = load_raw_image(file_path, width, height, pixel_type, header_size, memory_map=save_tiff)
+    if image_data is None:
         return
 
     if save_tiff:
-        # Ensure that the TIFF save path is valid and includes an extension
-        if tiff_path is None:
-            tiff_path = os.path.splitext(file_path)[0] + '.tiff'
-        elif os.path.isdir(tiff_path):  # If tiff_path is a folder, add the file name
-            tiff_path = os.path.join(tiff_path, os.path.basename(os.path.splitext(file_path)[0] + '.tiff'))
-
-        # Now tiff_path should be a valid file path containing the file name and .tiff extension
-        Image.fromarray(image_data).save(tiff_path)
-        print(f"TIFF file saved: {tiff_path}")
+        _save_tiff(image_data, _resolve_tiff_path(file_path, tiff_path), compression)
     else:
         # Display the image
         Image.fromarray(image_data).show()
 
+    return image_data
+
+
+def _process_raw_file_fast(file_path, tiff_path, read, compression='zlib', maxworkers=None):
+    """
+    Converts a RAW file into a TIFF with a reader from make_raw_reader,
+    skipping the parameter checks of process_raw_file.
+
+    :param file_path: Path to the RAW file.
+    :param tiff_path: Full path of the TIFF file to save.
+    :param read: Reader for the RAW file parameters of the batch.
+    :param compression: TIFF compression passed to tifffile.
+    :param maxworkers: Number of tifffile compression threads, or None for tifffile's default.
+    :return: Array with the image data, or None if it could not be read.
+    """
+    image_data = _read_or_report(read, file_path)
+    if image_data is None:
+        return
+
+    _save_tiff(image_data, tiff_path, compression, maxworkers)
+    return image_data
+
+
+def _resolve_tiff_path(file_path, tiff_path):
+    """
+    Returns a valid TIFF file path, including the file name and .tiff extension.
+    """
+    if tiff_path is None:
+        return os.path.splitext(file_path)[0] + '.tiff'
+    if os.path.isdir(tiff_path):  # If tiff_path is a folder, add the file name
+        return os.path.join(tiff_path, os.path.basename(os.path.splitext(file_path)[0] + '.tiff'))
+    return tiff_path
+
+
+def _write_tiff(file, image_data, compression, maxworkers=None):
+    """
+    Writes the image data as a TIFF to a file path or a binary file object.
+    Callers that already convert several files in parallel pass maxworkers=1,
+    so tifffile does not start its own compression threads for every image.
+    """
+    # The encoder needs C-contiguous pixels, make the copy explicit for sliced or flipped views
+    if not image_data.flags['C_CONTIGUOUS']:
+        image_data = np.ascontiguousarray(image_data)
+    options = {}
+    if compression is not None:
+        # Tiles and the predictor only pay off when compressing, uncompressed tiles just add padding
+        options['tile'] = TIFF_TILE
+        options['predictor'] = True
+        if compression == 'zlib':
+            options['compressionargs'] = {'level': TIFF_DEFLATE_LEVEL}
+    tifffile.imwrite(file, image_data, compression=compression, maxworkers=maxworkers, **options)
+
+
+def _save_tiff(image_data, tiff_path, compression, maxworkers=None):
+    """
+    Saves the image data as a TIFF file.
+    """
+    _write_tiff(tiff_path, image_data, compression, maxworkers)
+    print(f"TIFF file saved: {tiff_path}")
+
+
+def _encode_tiff(image_data, compression):
+    """
+    Encodes the image data as TIFF file bytes, with the same settings as _save_tiff.
+    tifffile's codecs release the GIL while compressing, so several images can be encoded in parallel threads,
+    each image with a single compression thread.
+
+    :param image_data: Array with the image data.
+    :param compression: TIFF compression passed to tifffile.
+    :return: TIFF file bytes.
+    """
+    buffer = io.BytesIO()
+    _write_tiff(buffer, image_data, compression, maxworkers=1)
+    return buffer.getvalue()
+
+
+def _build_tiff_header(width, height, bits=16):
+    """
+    Builds a minimal little-endian TIFF header for an uncompressed grayscale image,
+    with the pixel data following the header as a single strip.
+
+    :param width: Image width.
+    :param height: Image height.
+    :param bits: Bits per pixel (16 or 8).
+    :return: TIFF header bytes.
+    """
+    entries = [
+        (256, _TIFF_LONG, width),  # ImageWidth
+        (257, _TIFF_LONG, height),  # ImageLength
+        (258, _TIFF_SHORT, bits),  # BitsPerSample
+        (259, _TIFF_SHORT, 1),  # Compression: none
+        (262, _TIFF_SHORT, 1),  # PhotometricInterpretation: MinIsBlack
+        (273, _TIFF_LONG, None),  # StripOffsets: end of the header, filled in below
+        (277, _TIFF_SHORT, 1),  # SamplesPerPixel
+        (278, _TIFF_LONG, height),  # RowsPerStrip: the whole image is one strip
+        (279, _TIFF_LONG, width * height * bits // 8),  # StripByteCounts
+    ]
+    # File header, IFD entry count, 12 bytes per entry and the offset of the next IFD
+    header_size = 8 + 2 + 12 * len(entries) + 4
+
+    header = struct.pack('<2sHIH', b'II', 42, 8, len(entries))
+    for tag, field_type, value in entries:
+        if value is None:
+            value = header_size
+        if field_type == _TIFF_SHORT:
+            header += struct.pack('<HHIH2x', tag, field_type, 1, value)
+        else:
+            header += struct.pack('<HHII', tag, field_type, 1, value)
+    header += struct.pack('<I', 0)  # No further IFDs
+
+    return header
+
+
+def _copy_raw_tiff(file_path, tiff_path, tiff_header, header_size, nbytes):
+    """
+    Saves a RAW file as an uncompressed TIFF file by writing the prebuilt header followed by the pixels,
+    copied from the RAW file without passing through Python. The pixels are copied as they are,
+    so they must be little-endian like the header.
+
+    :param file_path: Path to the RAW file.
+    :param tiff_path: Full path of the TIFF file to save.
+    :param tiff_header: Header from _build_tiff_header.
+    :param header_size: Header size of the RAW file in bytes.
+    :param nbytes: Size of the pixel data in bytes.
+    """
+    with open(file_path, 'rb') as raw_file:
+        # A file that is not exactly the header plus the pixels means the parameters are wrong
+        file_size = os.fstat(raw_file.fileno()).st_size
+        if file_size != header_size + nbytes:
+            print(f"Error: {file_path} has {file_size} bytes but the header and pixel data need "
+                  f"{header_size + nbytes}. Check the provided dimensions and header size.")
+            return
+
+        with open(tiff_path, 'wb') as tiff_file:
+            tiff_file.write(tiff_header)
+            tiff_file.flush()
+            copied = 0
+            try:
+                # The kernel copies the pixels straight from one file to the other
+                while copied < nbytes:
+                    sent = os.sendfile(tiff_file.fileno(), raw_file.fileno(), header_size + copied,
+                                       nbytes - copied)
+                    if sent == 0:
+                        break
+                    copied += sent
+            except (AttributeError, OSError):
+                # No os.sendfile on Windows, and some systems only send to sockets
+                tiff_file.seek(len(tiff_header))
+                tiff_file.truncate()
+                raw_file.seek(header_size)
+                shutil.copyfileobj(raw_file, tiff_file, length=READ_BUFFER_SIZE)
+                copied = tiff_file.tell() - len(tiff_header)
+
+    # The file can still change while it is copied
+    if copied != nbytes:
+        os.remove(tiff_path)
+        print(f"Error: expected {nbytes} bytes of pixel data in {file_path}, got {copied}. "
+              f"Check the provided dimensions and header size.")
+        return
+    print(f"TIFF file saved: {tiff_path}")
+
+
+def _write_encoded_tiff(encoded, tiff_path):
+    """
+    Saves a TIFF file encoded by _encode_tiff, waiting for the encoding to finish.
+
+    :param encoded: Future with the TIFF file bytes.
+    :param tiff_path: Full path of the TIFF file to save.
+    """
+    Path(tiff_path).write_bytes(encoded.result())
+    print(f"TIFF file saved: {tiff_path}")
+
+
+def _writer_worker(writer_queue):
+    """
+    Runs queued (save, tiff_path) items, where save writes the TIFF file, until None is queued.
+    """
+    while True:
+        item = writer_queue.get()
+        if item is None:
+            break
+        save, tiff_path = item
+        try:
+            save()
+        except Exception as e:
+            # Any error, including one raised by an encoder future, must not end this thread:
+            # keep draining the queue so the reading thread never blocks on a dead writer
+            print(f"Error: could not save {tiff_path}: {e}")
+
 
 def display_image(image_data):
+    # The screen cannot show more pixels than this anyway, so only scale a strided view of the image
+    stride = -(-max(image_data.shape) // DISPLAY_MAX_SIZE)  # Ceil division, so the view never exceeds the limit
+    image_data = image_data[::stride, ::stride]
+
     # Scale data to 8-bit range
     min_val, max_val = np.min(image_data), np.max(image_data)
-    scaled_data = (image_data - min_val) / (max_val - min_val)  # Normalize to range [0, 1]
-    display_data = (scaled_data * 255).astype(np.uint8)  # Scale to range [0, 255]
+    scale = np.float32(255) / max(int(max_val) - int(min_val), 1)  # Map [min, max] to [0, 255]
+    # Write straight into the 8-bit result, without a float64 intermediate image
+    display_data = np.empty(image_data.shape, dtype=np.uint8)
+    np.multiply(image_data - min_val, scale, out=display_data, casting='unsafe')
     plt.imshow(display_data, cmap='gray')
     plt.title('Scaled RAW Image')
     plt.show()
 
 
+# Reader and raw copy arguments of the current worker process, set up once by _init_worker_reader
+_worker_read = None
+_worker_copy_args = None
+
+
+def _init_worker_reader(width, height, pixel_type, header_size, tiff_header=None):
+    """
+    Creates the reader for a worker process, readers are closures and cannot be sent to workers.
+    With a prebuilt tiff_header, the worker copies the pixels into uncompressed TIFFs instead of reading them.
+    """
+    global _worker_read, _worker_copy_args
+    _worker_read = make_raw_reader(width, height, pixel_type, header_size)
+    if tiff_header is not None:
+        nbytes = width * height * np.dtype(_data_type(pixel_type)).itemsize
+        _worker_copy_args = (tiff_header, header_size, nbytes)
+
+
+def _convert_fixed(file_path, tiff_path, compression='zlib'):
+    """
+    Converts a single RAW file into a TIFF at the full path tiff_path with the reader of the worker process.
+    """
+    if _worker_copy_args is not None:
+        _copy_raw_tiff(file_path, tiff_path, *_worker_copy_args)
+    else:
+        _process_raw_file_fast(file_path, tiff_path, _worker_read, compression, maxworkers=1)
+
+
+def _convert_one(file_path, tiff_path, width=-1, height=-1, pixel_type=-1, header_size=-1,
+                 compression='zlib'):
+    """
+    Converts a single RAW file into a TIFF at the full path tiff_path in a worker process,
+    reading parameters from the file if set to -1.
+    """
+    image_data = load_raw_image(file_path, width, height, pixel_type, header_size, memory_map=True)
+    if image_data is not None:
+        _save_tiff(image_data, tiff_path, compression, maxworkers=1)
+
+
 def process_path(path, save_tiff=True, display_images=False, width=-1, height=-1, pixel_type=-1, header_size=-1,
-                 tiff_path=None):
+                 tiff_path=None, compression='zlib'):
     """
     Processes a file or all RAW files in a folder into TIFF images and optionally displays them.
+    When only saving TIFFs, the files in a folder are converted in parallel worker processes,
+    unless tiff_path is a single file that every conversion would overwrite.
     """
-    if os.path.isdir(path):
-        # Process all RAW files in the folder
-        for filename in os.listdir(path):
-            if filename.lower().endswith('.raw'):
-                file_path = os.path.join(path, filename)
-                output_tiff_path = tiff_path if tiff_path else os.path.join(path,
-                                                                            os.path.splitext(filename)[0] + '.tiff')
-                process_raw_file(file_path, width, height, pixel_type, header_size, save_tiff=save_tiff,
-                                 tiff_path=output_tiff_path)
-                if display_images:
-                    width, height, data_type, header_size = read_raw_parameters(file_path)
-                    image_dims = (height, width)
-                    with open(file_path, 'rb') as file:
-                        file.seek(header_size)
-                        raw_data = np.fromfile(file, dtype=data_type).reshape(image_dims)
-                    display_image(raw_data)
+    # With user-supplied parameters, bake them into a reader once for the whole batch.
+    # Worker processes build their own reader, so the sequential loops create theirs only when needed.
+    fixed_params = (width, height, pixel_type, header_size)
+    if -1 not in fixed_params:
+        # Reject an unsupported pixel type before any worker starts
+        try:
+            data_type = _data_type(pixel_type)
+        except KeyError as e:
+            print(f"Error: {e.args[0]} Check the provided pixel type.")
+            return
+        load = None
+        convert = partial(_convert_fixed, compression=compression)
+        # Uncompressed TIFFs of a fixed shape all share one header, the pixels are copied after it as they are
+        tiff_header = None
+        if compression is None:
+            tiff_header = _build_tiff_header(width, height, np.dtype(data_type).itemsize * 8)
+        pool_options = {'initializer': _init_worker_reader, 'initargs': fixed_params + (tiff_header,)}
+    else:
+        load = partial(load_raw_image, width=width, height=height, pixel_type=pixel_type,
+                       header_size=header_size, memory_map=True)
+        convert = partial(_convert_one, width=width, height=height, pixel_type=pixel_type,
+                          header_size=header_size, compression=compression)
+        pool_options = {}
+
+    # Resolve where the TIFFs go once, so each file only needs its name appended
+    is_dir = os.path.isdir(path)
+    tiff_file = None
+    if not tiff_path:  # None or '' puts the TIFFs next to the RAW files
+        tiff_dir = Path(path) if is_dir else Path(path).parent
+    elif Path(tiff_path).is_dir():
+        tiff_dir = Path(tiff_path)
+    else:
+        tiff_file = tiff_path
+
+    # Workers writing one shared tiff_file at the same time could corrupt it, so that case stays sequential
+    if is_dir and save_tiff and not display_images and tiff_file is None:
+        # Convert all RAW files in the folder in parallel, each file is independent
+        file_paths = []
+        output_tiff_paths = []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.lower().endswith('.raw'):
+                    file_paths.append(entry.path)
+                    output_tiff_paths.append(tiff_file or tiff_dir / (Path(entry.name).stem + '.tiff'))
+        with ProcessPoolExecutor(max_workers=os.cpu_count(), **pool_options) as executor:
+            list(executor.map(convert, file_paths, output_tiff_paths, chunksize=4))
+
+    elif is_dir and save_tiff:
+        # Process all RAW files in the folder one by one, displaying is bound to the GUI
+        # and a single tiff_file has to be overwritten in order.
+        if load is None:
+            load = partial(_read_or_report, make_raw_reader(*fixed_params))
+        # A background thread saves the TIFFs so writing overlaps reading and displaying the next file.
+        # Compressed TIFFs are encoded in a thread pool, the writer saves the encoded files in order.
+        encoder = ThreadPoolExecutor(max_workers=os.cpu_count()) if compression is not None else None
+        writer_queue = queue.Queue(maxsize=max(2, os.cpu_count() or 1))
+        writer = threading.Thread(target=_writer_worker, args=(writer_queue,), daemon=True)
+        writer.start()
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.name.lower().endswith('.raw'):
+                        image_data = load(entry.path)
+                        if image_data is None:
+                            continue
+                        output_tiff_path = tiff_file or tiff_dir / (Path(entry.name).stem + '.tiff')
+                        if encoder is not None:
+                            save = partial(_write_encoded_tiff, encoder.submit(_encode_tiff, image_data, compression),
+                                           output_tiff_path)
+                        else:
+                            save = partial(_save_tiff, image_data, output_tiff_path, compression)
+                        writer_queue.put((save, output_tiff_path))
+                        if display_images:
+                            display_image(image_data)
+        finally:
+            writer_queue.put(None)
+            writer.join()
+            if encoder is not None:
+                encoder.shutdown()
+
+    elif is_dir:
+        # Show all RAW files in the folder one by one
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.lower().endswith('.raw'):
+                    image_data = process_raw_file(entry.path, width, height, pixel_type, header_size,
+                                                  save_tiff=False)
+                    if display_images and image_data is not None:
+                        display_image(image_data)
 
     elif os.path.isfile(path):
         # Process a single RAW file
-        output_tiff_path = tiff_path if tiff_path else os.path.splitext(path)[0] + '.tiff'
-        process_raw_file(path, width, height, pixel_type, header_size, save_tiff=save_tiff, tiff_path=output_tiff_path)
-        if display_images:
-            width, height, data_type, header_size = read_raw_parameters(path)
-            image_dims = (height, width)
-            with open(path, 'rb') as file:
-                file.seek(header_size)
-                raw_data = np.fromfile(file, dtype=data_type).reshape(image_dims)
-            display_image(raw_data)
+        output_tiff_path = tiff_file or tiff_dir / (Path(path).stem + '.tiff')
+        image_data = process_raw_file(path, width, height, pixel_type, header_size, save_tiff=save_tiff,
+                                      tiff_path=output_tiff_path, compression=compression)
+        if display_images and image_data is not None:
+            display_image(image_data)
     else:
         print(f"The provided path {path} is neither a folder nor a file.")
 
 
-"""
-Path can be a path to a folder or
-a specific RAW file, e.g., C:\Files\Engineering\Projections\python_test_05_0007.raw
-or C:\Files\Engineering\Projections.
-If it is a folder path, all images will be processed.
-Target_path - location to save TIFFs. If "None", they will be saved in the RAW folder. 
-"""
-
-path = r'C:\Files\Engineering\Projections'
-target_path = None
-process_path(path,
-             save_tiff=True,
-             display_images=False,
-             tiff_path=target_path)
-"""
-save_tiff = True - saves RAW files as TIFF,
-display_images = True - displays each single image on the screen.
-If values are not read correctly, use:
-"""
-# process_path(path, save_tiff=True,
-#              display_images=False,
-#              width=2976,
-#              height=2480,
-#              pixel_type=16,
-#              header_size=2048)
+if __name__ == '__main__':
+    """
+    Path can be a path to a folder or
+    a specific RAW file, e.g., C:\Files\Engineering\Projections\python_test_05_0007.raw
+    or C:\Files\Engineering\Projections.
+    If it is a folder path, all images will be processed.
+    Target_path - location to save TIFFs. If "None", they will be saved in the RAW folder. 
+    """
+
+    path = r'C:\Files\Engineering\Projections'
+    target_path = None
+    process_path(path,
+                 save_tiff=True,
+                 display_images=False,
+                 tiff_path=target_path)
+    """
+    save_tiff = True - saves RAW files as TIFF,
+    display_images = True - displays each single image on the screen.
+    If values are not read correctly, use:
+    """
+    # process_path(path, save_tiff=True,
+    #              display_images=False,
+    #              width=2976,
+    #              height=2480,
+    #              pixel_type=16,
+    #              header_size=2048)